@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from itertools import combinations
+from itertools import combinations, product
 from typing import TYPE_CHECKING
 from warnings import warn
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache, reduce
 
 import sympy
 from sympy import (
@@ -39,10 +39,11 @@ from sympy import (
     Poly,
 )
 from sympy.polys.polyerrors import UnsolvableFactorError
+from sympy.core.relational import Relational
 from sympy.logic.boolalg import Boolean
 
 if TYPE_CHECKING:
-    from typing import Iterable, Literal
+    from typing import Iterable
 
 from symconstraints.operation import Imputation, Validation
 
@@ -55,6 +56,7 @@ _assumption_domain = {
 }
 
 
+@lru_cache(maxsize=None)
 def _get_symbol_domain(symbol):
     result = S.Complexes
     for assumption, is_assumption_true in symbol.assumptions0.items():
@@ -68,23 +70,50 @@ def _get_symbol_domain(symbol):
     return result
 
 
+# Relation tags for _DummyRelation: plain integer comparisons are cheaper than
+# string matching in the pairing loops below.
+_REL_EQ = 0
+_REL_GT = 1
+_REL_LT = 2
+
+
+def _is_solved_for(relation: Basic, dummy: Dummy) -> bool:
+    """Whether the relation already isolates the dummy against a finite bound."""
+    if not isinstance(relation, (Eq, Ge, Gt, Le, Lt)):
+        return False
+    if relation.lhs == dummy:
+        bound = relation.rhs
+    elif relation.rhs == dummy:
+        bound = relation.lhs
+    else:
+        return False
+    return bound.is_infinite is not True and dummy not in bound.free_symbols
+
+
 class _DummyRelation:
-    rel: Literal["<", ">", "=", "!"]
+    __slots__ = ("rel", "expr", "strict")
+
+    rel: int | None
     expr: Basic
     strict: bool
 
     def __init__(self, relation: Basic, dummy: Dummy):
-        relation = reduce_inequalities(relation, dummy)
+        # Relations coming from Interval.as_relational and friends are already
+        # solved for the dummy; only send the rest through the inequality
+        # solver.
+        if not _is_solved_for(relation, dummy):
+            relation = reduce_inequalities(relation, dummy)
+        self.rel = None
         self.strict = isinstance(relation, (Lt, Gt))
         if isinstance(relation, Eq):
-            self.rel = "="
+            self.rel = _REL_EQ
             self.expr = relation.rhs if relation.lhs == dummy else relation.lhs
-        elif isinstance(relation, Ge | Gt | Le | Lt):
+        elif isinstance(relation, (Ge, Gt, Le, Lt)):
             if relation.gts == dummy:
-                self.rel = ">"
+                self.rel = _REL_GT
                 self.expr = relation.lts
             else:
-                self.rel = "<"
+                self.rel = _REL_LT
                 self.expr = relation.gts
 
         if self.rel is None:
@@ -97,44 +126,121 @@ def _is_even_root(expr: _DummyRelation):
 
 def _and_dummy_to_constraints(and_relation: And, dummy: Dummy) -> set[Boolean]:
     constraints: set[Boolean] = set()
-    useful_relations = []
-    for rel in and_relation.args:
+    equalities: list[tuple[int, _DummyRelation]] = []
+    lower_bounds: list[tuple[int, _DummyRelation]] = []
+    upper_bounds: list[tuple[int, _DummyRelation]] = []
+    for index, rel in enumerate(and_relation.args):
         try:
-            useful_relations.append(_DummyRelation(rel, dummy))
+            relation = _DummyRelation(rel, dummy)
         except ValueError as e:
             warn(str(e))
+            continue
+        if relation.rel == _REL_EQ:
+            equalities.append((index, relation))
+        elif relation.rel == _REL_GT:
+            lower_bounds.append((index, relation))
+        else:
+            upper_bounds.append((index, relation))
+
+    if len(equalities) + len(lower_bounds) + len(upper_bounds) < 2:
+        # Nothing to pair up: every derived constraint relates two relations.
+        return constraints
+
+    for (_, relation1), (_, relation2) in combinations(equalities, 2):
+        constraints.add(Eq(relation1.expr, relation2.expr))
+
+    # Only lower/upper bound pairs produce an inequality, so pair the two
+    # buckets directly instead of scanning every combination. Equalities bound
+    # the dummy from both sides and take part in either role. The relation
+    # appearing first in the conjunction keeps the left-hand side, as it did
+    # when all pairs were scanned in order.
+    for (lower_index, lower), (upper_index, upper) in product(
+        lower_bounds + equalities, upper_bounds + equalities
+    ):
+        if lower_index == upper_index or lower.rel == upper.rel == _REL_EQ:
+            continue
+        if ask(Eq(lower.expr, -upper.expr)) and (
+            _is_even_root(lower) or _is_even_root(upper)
+        ):
+            # This is a workaround to a bug where SymPy doesn't recognize the square roots are always nonnegative
+            # in the real domain
+            continue
+
+        strict = lower.strict or upper.strict
+        constraints.add(
+            (Lt if strict else Le)(lower.expr, upper.expr)
+            if lower_index < upper_index
+            else (Gt if strict else Ge)(upper.expr, lower.expr)
+        )
 
-    for relation1, relation2 in combinations(useful_relations, 2):
-        strict = relation1.strict or relation2.strict
-        match (relation1.rel, relation2.rel):
-            case ("=", "="):
-                constraints.add(Eq(relation1.expr, relation2.expr))
-            case (">" | "=", "<" | "="):
-                if ask(Eq(relation1.expr, -relation2.expr)) and (
-                    _is_even_root(relation1) or _is_even_root(relation2)
-                ):
-                    # This is a workaround to a bug where SymPy doesn't recognize the square roots are always nonnegative
-                    # in the real domain
-                    continue
+    return constraints
 
-                constraints.add((Lt if strict else Le)(relation1.expr, relation2.expr))
-            case ("<" | "=", ">" | "="):
-                if ask(Eq(relation1.expr, -relation2.expr)) and (
-                    _is_even_root(relation1) or _is_even_root(relation2)
-                ):
-                    # This is a workaround to a bug where SymPy doesn't recognize the square roots are always nonnegative
-                    # in the real domain
-                    continue
 
-                constraints.add((Gt if strict else Ge)(relation1.expr, relation2.expr))
+def _relational_dnf(relational: Boolean) -> Boolean:
+    """Convert a relational formula to disjunctive normal form.
 
-    return constraints
+    Relational atoms are substituted with fresh boolean dummies so that `simplify_logic` only
+    processes a small purely-boolean formula instead of the full relational tree, then the
+    atoms are substituted back. Identical relations share one dummy, deduplicating the
+    formula before simplification.
+    """
+    atom_to_dummy = {atom: Dummy() for atom in relational.atoms(Relational)}
+    simplified = simplify_logic(relational.xreplace(atom_to_dummy), form="dnf")
+    return simplified.xreplace({dummy: atom for atom, dummy in atom_to_dummy.items()})
 
 
-def _get_basic_symbols(basic: Basic):
-    return frozenset(
-        symbol for symbol in basic.free_symbols if isinstance(symbol, Symbol)
+def _infer_pair_constraints(
+    set1: sympy.Set, set2: sympy.Set, dummy: Dummy
+) -> tuple[tuple[Boolean, ...], bool]:
+    """Derive the constraints linking two sets inferred for the same symbol.
+
+    Returns the derived constraints and whether they came from a plain
+    conjunction, in which case they are also candidates for imputations. The
+    result only depends on the two sets and the dummy's assumptions, which
+    makes it safe to memoize across symbols.
+    """
+    intersection = set1.intersect(set2)
+    if intersection is S.EmptySet:
+        return (), False
+    if (
+        isinstance(set1, FiniteSet)
+        and isinstance(set2, FiniteSet)
+        and len(set1) == 1
+        and len(set2) == 1
+    ):
+        # Two solved values for the same symbol, the shape a system of pure
+        # equalities produces: equate them directly instead of pushing the
+        # unevaluated intersection through as_relational and the DNF pass.
+        relation = And(Eq(dummy, set1.args[0]), Eq(dummy, set2.args[0]))
+        if not isinstance(relation, And):
+            return (), False
+        return tuple(_and_dummy_to_constraints(relation, dummy)), True
+    # Intervals and finite sets already produce a flat
+    # conjunction/disjunction, so only compound sets need the DNF conversion.
+    dummy_relation = (
+        intersection.as_relational(dummy)
+        if isinstance(intersection, (FiniteSet, Interval))
+        else _relational_dnf(intersection.as_relational(dummy))
     )
+    if isinstance(dummy_relation, Or):
+        and_operations: list[Boolean] = []
+        for arg in dummy_relation.args:
+            if not isinstance(arg, And):
+                return (), False
+            and_operations.append(And(*_and_dummy_to_constraints(arg, dummy)))
+        return (Or(*and_operations),), False
+    if isinstance(dummy_relation, And):
+        return tuple(_and_dummy_to_constraints(dummy_relation, dummy)), True
+    return (), False
+
+
+@lru_cache(maxsize=None)
+def _get_basic_symbols(basic: Basic):
+    # free_symbols already only contains Symbol instances (Dummy included),
+    # so the frozenset can be built straight from it. Cached: the same
+    # constraint has its symbols looked up on insertion and again whenever it
+    # is re-derived from another pair of sets.
+    return frozenset(basic.free_symbols)
 
 
 @dataclass(frozen=True)
@@ -191,7 +297,7 @@ class Constraints:
     Imputation: (a) => b = a/2 inferred by (Eq(a, 2*b))
     """
 
-    _validations: list[Validation]
+    _validations: list[Validation] | None
     _imputations: list[Imputation]
 
     def __init__(self, constraints: Iterable[Boolean]):
@@ -202,12 +308,25 @@ class Constraints:
         constraints : Iterable[Boolean]
             List of SymPy Boolean expressions
         """
-        self._symbol_to_sets: defaultdict[Symbol, set[_InferredSet]] = defaultdict(set)
+        # Both containers deduplicate on (sort_key, inferred_by) tuples: sort_key
+        # gives a cheap canonical key, avoiding Set/Boolean equality checks on
+        # insertion while keeping entries that differ only in provenance.
+        self._symbol_to_sets: defaultdict[Symbol, dict[tuple, _InferredSet]] = (
+            defaultdict(dict)
+        )
         self._symbols_to_constraints: defaultdict[
-            frozenset[Symbol], set[_InferredConstraint]
-        ] = defaultdict(set)
+            frozenset[Symbol], dict[tuple, _InferredConstraint]
+        ] = defaultdict(dict)
         self._imputations = []
 
+        # Constructor-scoped memoization: the same (constraint, symbol) solves
+        # recur between the ingestion loop and the pairwise inference loop
+        # below. Plain dicts instead of lru_cache-wrapped locals keep the
+        # instance picklable. Symbol domains are cached at module level
+        # instead, as they are few and shared across instances.
+        self._solveset_cache: dict = {}
+        self._pair_constraints_cache: dict = {}
+
         for constraint in constraints:
             simplified_constraint = simplify_logic(constraint, form="cnf", force=True)
             if isinstance(simplified_constraint, And):
@@ -217,8 +336,29 @@ class Constraints:
             else:
                 self._add_constraint(simplified_constraint, constraint)
 
+        dummies: dict[frozenset, Dummy] = {}
+        # The same pair of inferring constraints shows up once per symbol they
+        # share; interning keeps one frozenset per pair instead of one per
+        # derived constraint.
+        inferred_by_intern: dict[frozenset[Boolean], frozenset[Boolean]] = {}
         for symbol, symbol_sets in self._symbol_to_sets.items():
-            for inferred_set1, inferred_set2 in combinations(symbol_sets, 2):
+            # Intersect the structurally cheapest sets first so the expensive
+            # pairs only run after the simple ones have been pruned. The key
+            # must not enumerate set members: count_ops iterates any iterable
+            # set, which hangs on the infinite domains (Integers, Range) that
+            # integer-assumption symbols produce.
+            sorted_sets = sorted(
+                symbol_sets.values(),
+                key=lambda inferred: len(inferred.inferred_set.args),
+            )
+            # One dummy per assumption set: the dummy never survives into the
+            # derived constraints, so symbols with the same assumptions share
+            # it and with it the memoized pair pipeline.
+            assumptions = frozenset(symbol.assumptions0.items())
+            dummy = dummies.get(assumptions)
+            if dummy is None:
+                dummy = dummies[assumptions] = Dummy(**symbol.assumptions0)
+            for inferred_set1, inferred_set2 in combinations(sorted_sets, 2):
                 set1, inferred_by1 = (
                     inferred_set1.inferred_set,
                     inferred_set1.inferred_by,
@@ -227,73 +367,74 @@ class Constraints:
                     inferred_set2.inferred_set,
                     inferred_set2.inferred_by,
                 )
+                # A pair where one set contains the other adds nothing: the
+                # intersection is just the smaller set, whose bounds were
+                # already derived from its own constraint. is_subset may
+                # return None for symbolic bounds, so only a definite True
+                # skips.
+                if (
+                    set1 == set2
+                    or set1.is_subset(set2) is True
+                    or set2.is_subset(set1) is True
+                ):
+                    continue
+                derived, with_imputations = self._pair_constraints(set1, set2, dummy)
+                if len(derived) == 0:
+                    continue
                 inferred_by = frozenset([inferred_by1, inferred_by2])
-                dummy = Dummy(**symbol.assumptions0)
-                dummy_relation = simplify_logic(
-                    set1.intersect(set2).as_relational(dummy), form="dnf"
-                )
-                if isinstance(dummy_relation, Or):
-                    and_operations: list[Boolean] = []
-                    for arg in dummy_relation.args:
-                        if isinstance(arg, And):
-                            and_operations.append(
-                                And(*_and_dummy_to_constraints(arg, dummy))
-                            )
-                        else:
-                            and_operations = []
-                            break
-                    if len(and_operations) > 0:
-                        simplified_constraint = Or(*and_operations)
-                        self._symbols_to_constraints[
-                            _get_basic_symbols(simplified_constraint)
-                        ].add(_InferredConstraint(simplified_constraint, inferred_by))
-                elif isinstance(dummy_relation, And):
-                    for simplified_constraint in _and_dummy_to_constraints(
-                        dummy_relation, dummy
-                    ):
-                        constraint_symbols = _get_basic_symbols(simplified_constraint)
-                        self._symbols_to_constraints[constraint_symbols].add(
-                            _InferredConstraint(simplified_constraint, inferred_by)
-                        )
+                inferred_by = inferred_by_intern.setdefault(inferred_by, inferred_by)
+                for simplified_constraint in derived:
+                    constraint_symbols = _get_basic_symbols(simplified_constraint)
+                    self._symbols_to_constraints[constraint_symbols][
+                        (simplified_constraint.sort_key(), inferred_by)
+                    ] = _InferredConstraint(simplified_constraint, inferred_by)
+                    if with_imputations:
                         for constraint_symbol in constraint_symbols:
-                            constraint_symbol_set = solveset(
-                                simplified_constraint,
-                                constraint_symbol,
-                                domain=_get_symbol_domain(constraint_symbol),
+                            constraint_symbol_set = self._solveset(
+                                simplified_constraint, constraint_symbol
                             )
                             self._add_possible_imputation_from_set(
                                 constraint_symbol_set, constraint_symbol, inferred_by
                             )
 
-        self._validations = [
-            Validation(
-                frozenset(symbols),
-                frozenset(
-                    inferred_constraint.constraint
-                    for inferred_constraint in inferred_constraints
-                ),
-                inferred_by=reduce(
-                    lambda a, b: a | b.inferred_by, inferred_constraints, frozenset()
-                ),
+        # The Validation objects are only materialized on first access to the
+        # validations property.
+        self._validations = None
+
+    def _solveset(self, constraint: Boolean, symbol: Symbol) -> sympy.Set:
+        key = (constraint, symbol)
+        result = self._solveset_cache.get(key)
+        if result is None:
+            result = self._solveset_cache[key] = solveset(
+                constraint, symbol, domain=_get_symbol_domain(symbol)
             )
-            for symbols, inferred_constraints in self._symbols_to_constraints.items()
-            if len(symbols) > 0
-        ]
+        return result
+
+    def _pair_constraints(
+        self, set1: sympy.Set, set2: sympy.Set, dummy: Dummy
+    ) -> tuple[tuple[Boolean, ...], bool]:
+        key = (set1, set2, dummy)
+        result = self._pair_constraints_cache.get(key)
+        if result is None:
+            result = self._pair_constraints_cache[key] = _infer_pair_constraints(
+                set1, set2, dummy
+            )
+        return result
 
     def _add_constraint(self, constraint: Boolean, inferred_by: Boolean):
         inferred_by_set = frozenset([inferred_by])
         symbols = _get_basic_symbols(constraint)
-        self._symbols_to_constraints[symbols].add(
-            _InferredConstraint(constraint, inferred_by_set)
-        )
+        self._symbols_to_constraints[symbols][
+            (constraint.sort_key(), inferred_by_set)
+        ] = _InferredConstraint(constraint, inferred_by_set)
         for symbol in symbols:
-            symbol_set = solveset(constraint, symbol, domain=_get_symbol_domain(symbol))
+            symbol_set = self._solveset(constraint, symbol)
             if isinstance(symbol_set, Intersection):
                 for subset in symbol_set.args:
                     if isinstance(subset, sympy.Set):
-                        self._symbol_to_sets[symbol].add(
-                            _InferredSet(subset, inferred_by)
-                        )
+                        self._symbol_to_sets[symbol][
+                            (subset.sort_key(), inferred_by)
+                        ] = _InferredSet(subset, inferred_by)
                         self._add_possible_imputation_from_set(
                             subset, symbol, inferred_by_set
                         )
@@ -301,7 +442,7 @@ class Constraints:
                 # solveset couldn't return a simple set. Attempt to solve manually.
                 # Is it a polynomial inequality?
                 if (
-                    isinstance(symbol_set.condition, Le | Ge | Gt | Lt)
+                    isinstance(symbol_set.condition, (Le, Ge, Gt, Lt))
                     and isinstance(symbol_set.condition.lts, Expr)
                     and isinstance(symbol_set.condition.gts, Expr)
                 ):
@@ -315,7 +456,7 @@ class Constraints:
                     if expr is not None and expr.is_polynomial(symbol):
                         # It is a polynomial inequality, solve it as such.
                         expr_poly = Poly(expr, symbol)
-                        strict = isinstance(symbol_set.condition, Gt | Lt)
+                        strict = isinstance(symbol_set.condition, (Gt, Lt))
                         GreaterThan = (
                             (lambda x: Interval.Lopen(x, oo))
                             if strict
@@ -382,13 +523,16 @@ class Constraints:
                                                 )
                                             )
                                         )
-                            self._symbol_to_sets[symbol].add(
-                                _InferredSet(Union(*union_args), inferred_by)
-                            )
+                            union = Union(*union_args)
+                            self._symbol_to_sets[symbol][
+                                (union.sort_key(), inferred_by)
+                            ] = _InferredSet(union, inferred_by)
                         except UnsolvableFactorError:
                             pass
             else:
-                self._symbol_to_sets[symbol].add(_InferredSet(symbol_set, inferred_by))
+                self._symbol_to_sets[symbol][(symbol_set.sort_key(), inferred_by)] = (
+                    _InferredSet(symbol_set, inferred_by)
+                )
                 self._add_possible_imputation_from_set(
                     symbol_set, symbol, inferred_by_set
                 )
@@ -417,6 +561,23 @@ class Constraints:
         list[Validation]
             Validation operations
         """
+        if self._validations is None:
+            self._validations = [
+                Validation(
+                    symbols,
+                    frozenset(
+                        inferred_constraint.constraint
+                        for inferred_constraint in inferred_constraints.values()
+                    ),
+                    inferred_by=reduce(
+                        lambda a, b: a | b.inferred_by,
+                        inferred_constraints.values(),
+                        frozenset(),
+                    ),
+                )
+                for symbols, inferred_constraints in self._symbols_to_constraints.items()
+                if len(symbols) > 0
+            ]
         return self._validations
 
     @property
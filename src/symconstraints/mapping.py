@@ -1,15 +1,29 @@
 """Basic implementations of operations to the standard python mapping (dict, defaultdict, etc.)."""
 
+from sympy import And, lambdify
 from sympy.logic.boolalg import Boolean
 from symconstraints import Validation, Constraints, Imputation
 
 from collections.abc import Mapping
+from functools import cache
 from typing import Any
 
 StringMap = Mapping[str, Any]
 """Any generic map that has a string key, such as dict, defaultdict, Counter, etc."""
 
 
+@cache
+def _lambdify(keys, operation):
+    return lambdify(keys, operation, modules=["math"])
+
+
+@cache
+def _str_keys(keys):
+    """Order an operation's keys and stringify them once per distinct key set."""
+    ordered = tuple(keys)
+    return ordered, tuple(str(key) for key in ordered)
+
+
 class ValidationError(Exception):
     """Validation error.
 
@@ -89,22 +103,36 @@ def validate(constraints: Constraints | Validation, mapping: StringMap):
     - Mapping {'a': 4, 'c': 1} is invalid due to not satisfying [a < c]
     """
     if isinstance(constraints, Validation):
-        values = dict((str(k), mapping.get(str(k))) for k in constraints.keys)
+        keys, str_keys = _str_keys(constraints.keys)
+        values = [mapping.get(str_key) for str_key in str_keys]
 
-        if any(mapping.get(str(key)) is None for key in constraints.keys):
+        if any(value is None for value in values):
             return
 
-        values_subs = [(k, mapping[str(k)]) for k in constraints.keys]
-
-        unsatisfied_expressions: list[Boolean] = [
-            operation
-            for operation in constraints.operations
-            if not operation.subs(values_subs)
-        ]
+        # Most mappings are valid: check all the operations fused into a single
+        # conjunction first, and only evaluate them individually to report
+        # which ones failed.
+        try:
+            if _lambdify(keys, And(*constraints.operations))(*values):
+                return
+        except Exception:
+            pass
+
+        unsatisfied_expressions: list[Boolean] = []
+        for operation in constraints.operations:
+            try:
+                satisfied = _lambdify(keys, operation)(*values)
+            except Exception:
+                # Not every relation survives lambdification; fall back to
+                # symbolic substitution. xreplace does a single traversal with
+                # no resimplification, which is all a numeric fill-in needs.
+                satisfied = operation.xreplace(dict(zip(keys, values)))
+            if not satisfied:
+                unsatisfied_expressions.append(operation)
 
         if len(unsatisfied_expressions) > 0:
             raise ValidationError(
-                values,
+                dict(zip(str_keys, values)),
                 unsatisfied_expressions,
             )
     elif isinstance(constraints, Constraints):
@@ -147,13 +175,15 @@ def impute(constraints: Imputation | Constraints, mapping: StringMap) -> dict[st
     {'a': 23, 'b': 10, 'c': 3, 'd': 69}
     """
     if isinstance(constraints, Imputation):
+        keys, str_keys = _str_keys(constraints.keys)
+        values = [mapping.get(str_key) for str_key in str_keys]
         if mapping.get(str(constraints.target_key)) is None and all(
-            mapping.get(str(key)) is not None for key in constraints.keys
+            value is not None for value in values
         ):
             return {
                 **mapping,
                 str(constraints.target_key): constraints.operation.subs(
-                    [(key, mapping[str(key)]) for key in constraints.keys]
+                    list(zip(keys, values))
                 ),
             }
         return dict(mapping)
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from sympy import Expr
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Operation:
     """Generic operation.
 
@@ -27,7 +27,7 @@ class Operation:
     inferred_by: frozenset[Boolean] = field(kw_only=True, default_factory=frozenset)
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Validation(Operation):
     """Validation operation.
 
@@ -49,7 +49,7 @@ class Validation(Operation):
         return str(self)
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Imputation(Operation):
     """Imputation operation.
 
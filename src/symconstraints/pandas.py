@@ -2,7 +2,9 @@
 
 import pandas
 import math
-from sympy import Symbol, lambdify
+import os
+from concurrent.futures import ThreadPoolExecutor
+from sympy import And, Symbol, lambdify
 from pandas.api.types import (
     is_unsigned_integer_dtype,
     is_integer_dtype,
@@ -17,10 +19,27 @@ from sympy.logic.boolalg import Boolean
 import numpy as np
 from operator import or_
 
+# check() result values by code: 0 = failed, 1 = passed, 2 = not computable.
+_CHECK_LUT = np.array([0.0, 1.0, math.nan], dtype=np.float16)
+
+# Assumptions for the common NumPy dtypes, keyed on the dtype itself: one hash
+# lookup instead of a chain of pandas dtype predicates. Extension dtypes miss
+# here and go through the predicates in `symbols` instead.
+_DTYPE_ASSUMPTIONS: dict = {
+    np.dtype(dtype_str): assumptions
+    for dtype_strs, assumptions in (
+        (("uint8", "uint16", "uint32", "uint64"), {"integer": True, "nonnegative": True}),
+        (("int8", "int16", "int32", "int64"), {"integer": True}),
+        (("float16", "float32", "float64"), {"real": True}),
+        (("complex64", "complex128"), {"complex": True}),
+    )
+    for dtype_str in dtype_strs
+}
+
 
 def symbols(
     df: pandas.DataFrame, symbol_list: str | list[str], **kwargs
-) -> Symbol | list[Symbol]:
+) -> tuple[Symbol, ...]:
     """Return SymPy symbols with assumptions inferred from the dataframe dtypes.
 
     Currently, it infers the following:
@@ -40,9 +59,9 @@ def symbols(
 
     Returns
     -------
-    Symbol | list[Symbol]
+    tuple[Symbol, ...]
         SymPy symbols with assumptions inferred from the dataframe dtypes, corresponding to each column given.
-        Returns a list if multiple columns are given, or a single symbol if a signle column is given.
+        Use `symbol` to get a single symbol for a single column.
 
     Raises
     ------
@@ -69,14 +88,15 @@ def symbols(
     """
     result = []
     symbols = symbol_list if isinstance(symbol_list, list) else symbol_list.split()
+    dtypes = df.dtypes
     for symbol in symbols:
-        symbol_dtype = df.dtypes.get(symbol)
-        if symbol_dtype is None:
+        if symbol not in dtypes:
             raise ValueError(
                 f"Column {symbol} does not exist in the dataframe provided. Available columns are {list(df.columns)}."
             )
+        symbol_dtype = dtypes[symbol]
 
-        assumptions = (
+        assumptions = _DTYPE_ASSUMPTIONS.get(symbol_dtype) or (
             {"integer": True, "nonnegative": True}
             if is_unsigned_integer_dtype(symbol_dtype)
             else {"integer": True}
@@ -95,13 +115,51 @@ def symbols(
 
         result.append(Symbol(symbol, **assumptions, **kwargs))
 
-    match len(result):
-        case 0:
-            raise ValueError("No symbols given.")
-        case 1:
-            return result[0]
+    if len(result) == 0:
+        raise ValueError("No symbols given.")
 
-    return result
+    return tuple(result)
+
+
+def symbol(df: pandas.DataFrame, column: str, **kwargs) -> Symbol:
+    """Return a SymPy symbol for one column, with assumptions inferred from its dtype.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataframe to infer symbol assumptions from.
+    column : str
+        Column to create a symbol for.
+    **kwargs: dict, optional
+        Extra arguments to be passed to `sympy.Symbol`
+
+    Returns
+    -------
+    Symbol
+        SymPy symbol with assumptions inferred from the column's dtype.
+
+    Raises
+    ------
+    ValueError
+        Raises a ValueError if the column is not found or has an unsupported dtype.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from symconstraints.pandas import symbol
+    >>> df = pd.DataFrame({'Level': [1]}).astype({'Level': 'uint8'})
+    >>> level = symbol(df, 'Level')
+    >>> level.is_nonnegative, level.is_integer
+    (True, True)
+    """
+    return symbols(df, [column], **kwargs)[0]
+
+
+@cache
+def _str_keys(keys):
+    """Order an operation's keys and stringify them once per distinct key set."""
+    ordered = tuple(keys)
+    return ordered, tuple(str(key) for key in ordered)
 
 
 @cache
@@ -109,6 +167,17 @@ def _lambdify(*args, **kwargs):
     return lambdify(*args, **kwargs, modules=["numpy"])
 
 
+@cache
+def _lambdify_many(columns, operations):
+    """Lambdify several operations into one function.
+
+    Common subexpressions shared between the operations (such as a product
+    appearing in several inferred validations) are lifted out and computed once
+    per call.
+    """
+    return lambdify(columns, operations, modules=["numpy"], cse=True)
+
+
 def check(
     constraints: Constraints | Validation, df: pandas.DataFrame
 ) -> pandas.DataFrame:
@@ -156,59 +225,130 @@ def check(
     3    NaN        NaN     NaN     NaN
     """
     if isinstance(constraints, Validation):
-        columns = tuple(constraints.keys)
+        columns, columns_str = _str_keys(constraints.keys)
         index: list[Boolean] = list(constraints.operations)
-        columns_str = [str(column) for column in columns]
 
-        relevant_indices = ~df[columns_str].isna().any(axis="columns")
-        if not isinstance(relevant_indices, pandas.Series):
-            raise RuntimeError(
-                f"unexpected type for relevant_indices: {type(relevant_indices)}"
+        frame = df[list(columns_str)]
+        try:
+            nan_mask = np.isnan(frame.to_numpy(copy=False)).any(axis=1)
+        except TypeError:
+            # np.isnan only handles numeric ndarrays; object or extension
+            # dtypes go through pandas' missing-value detection instead.
+            nan_mask = frame.isna().to_numpy().any(axis=1)
+        if nan_mask.all():
+            # No row has all of the validation's columns present, so skip the
+            # expression evaluation entirely.
+            return pandas.DataFrame(
+                np.full((len(df), len(index)), math.nan, dtype=np.float16),
+                index=df.index,
+                columns=pandas.Index(index),
             )
+        # Only rows with all columns present go through the kernel: object
+        # columns cannot evaluate rows holding None, and the missing rows'
+        # results are a known NaN anyway.
+        present = ~nan_mask
+        cols = [frame[column_str].to_numpy()[present] for column_str in columns_str]
+
+        # Evaluate all the operations over the filtered columns in one NumPy
+        # pass and scatter them into a NaN-prefilled result buffer, mapping
+        # each boolean through a lookup table: {0: failed, 1: passed},
+        # branchless and with no float64 temporaries.
+        out = np.full((len(df), len(index)), math.nan, dtype=np.float16)
+        for j, values in enumerate(_lambdify_many(columns, tuple(index))(*cols)):
+            out[present, j] = _CHECK_LUT[np.asarray(values, dtype=np.uint8)]
+
+        return pandas.DataFrame(out, index=df.index, columns=pandas.Index(index))
 
-        relevant_df = df[relevant_indices]
-        # Return a dataframe if the output is a series
+    if isinstance(constraints, Constraints):
+        validations = constraints.validations
+        if len(validations) > 1:
+            # The validations are independent and their kernels run in NumPy,
+            # which releases the GIL, so check them in parallel.
+            with ThreadPoolExecutor(
+                max_workers=min(len(validations), os.cpu_count() or 1)
+            ) as executor:
+                checks = list(
+                    executor.map(lambda validation: check(validation, df), validations)
+                )
+        else:
+            checks = [check(validation, df) for validation in validations]
+        results = list(
+            zip((validation.keys for validation in validations), checks)
+        )
+        # The per-validation results are already float16 buffers over df.index,
+        # so one concatenate plus one MultiIndex build assembles the frame
+        # without pandas.concat's per-block alignment and copies.
         return pandas.DataFrame(
-            pandas.concat(
-                [
-                    pandas.concat(
-                        dict(
-                            (
-                                operation,
-                                _lambdify(columns, operation)(
-                                    *(relevant_df[str(column)] for column in columns)
-                                ).astype("float16"),
-                            )
-                            for operation in index
-                        ),
-                        axis="columns",
-                    ),
-                    pandas.concat(
-                        dict(
-                            (
-                                operation,
-                                pandas.Series(
-                                    math.nan,
-                                    index=relevant_indices.index[~relevant_indices],
-                                    copy=True,
-                                ),
-                            )
-                            for operation in index
-                        ),
-                        axis="columns",
-                    ),
-                ],
-                axis="rows",
-            )
+            np.concatenate([result.to_numpy() for _, result in results], axis=1),
+            index=df.index,
+            columns=pandas.MultiIndex.from_tuples(
+                (keys, operation)
+                for keys, result in results
+                for operation in result.columns
+            ),
         )
 
-    if isinstance(constraints, Constraints):
-        return pandas.concat(
-            dict(
-                (validation.keys, check(validation, df))
-                for validation in constraints.validations
+    raise ValueError(f"Invalid constraints given: {constraints}")
+
+
+def invalid_rows(
+    constraints: Constraints | Validation, df: pandas.DataFrame
+) -> pandas.Index:
+    """Get the index of rows that fail a validation.
+
+    All the operations of each validation are fused into a single expression and
+    evaluated on whole columns at once, so no per-row Python code runs. Rows with
+    missing values in the columns of a validation cannot be checked by it and are
+    not reported.
+
+    Parameters
+    ----------
+    constraints : Constraints | Validation
+        `Constraints` or `Validation` to use for checking.
+    df : pandas.DataFrame
+        Dataframe to check.
+
+    Returns
+    -------
+    pandas.Index
+        Index of the rows that fail at least one validation.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from symconstraints import Constraints
+    >>> from symconstraints.pandas import symbols, invalid_rows
+    >>> df = pd.DataFrame({
+    ...     'A': [5, 6, 8, 9],
+    ...     'B': [3, 5, 90, None],
+    ... }, dtype=float)
+    >>> A, B = symbols(df, 'A B')
+    >>> list(invalid_rows(Constraints([A > B]), df))
+    [2]
+    """
+    if isinstance(constraints, Validation):
+        columns, columns_str = _str_keys(constraints.keys)
+
+        # As in check(), only rows with all columns present can go through
+        # the fused expression: object columns fail on missing values.
+        relevant = df[list(columns_str)].notna().all(axis="columns").to_numpy()
+        if not relevant.any():
+            return df.index[:0]
+        satisfied = np.asarray(
+            _lambdify(columns, And(*constraints.operations))(
+                *(df[column_str].to_numpy()[relevant] for column_str in columns_str)
             ),
-            axis="columns",
+            dtype=bool,
+        )
+        failed = np.zeros(len(df), dtype=bool)
+        failed[relevant] = ~satisfied
+        return df.index[failed]
+
+    if isinstance(constraints, Constraints):
+        return reduce(
+            pandas.Index.union,
+            (invalid_rows(validation, df) for validation in constraints.validations),
+            df.index[:0],
         )
 
     raise ValueError(f"Invalid constraints given: {constraints}")
@@ -271,8 +411,9 @@ def set_invalid_all(
             raise ValueError(
                 f"Invalid check result given. It has a column {column_item} of type: {type(column_item)}"
             )
+        # NaN means not computable, which counts as valid; only 0.0 fails.
         result.loc[
-            ~check_result.fillna(1.0).all(axis="columns"),
+            (check_result.to_numpy() == 0.0).any(axis=1),
             [str(symbol) for symbol in column_item.free_symbols],
         ] = fill
 
@@ -284,11 +425,26 @@ def set_invalid_all(
     if len(invalid_keysets) > 0:
         raise ValueError(f"Found invalid columns in check result: {invalid_keysets}")
 
-    for keys in keysets:
-        result.loc[
-            ~check_result[keys].fillna(1.0).all(axis="columns"),
-            [str(key) for key in keys],
-        ] = fill
+    # One pass over the check matrix: OR-reduce the failures of each keyset's
+    # columns into a row mask, then combine the masks per dataframe column so
+    # each column is written at most once.
+    failed = check_result.to_numpy() == 0.0
+
+    keyset_columns: dict[frozenset, list[int]] = {}
+    for j, keys in enumerate(keysets):
+        keyset_columns.setdefault(keys, []).append(j)
+
+    column_masks: dict[str, np.ndarray] = {}
+    for keys, check_columns in keyset_columns.items():
+        mask = failed[:, check_columns].any(axis=1)
+        for column_str in _str_keys(keys)[1]:
+            previous_mask = column_masks.get(column_str)
+            column_masks[column_str] = (
+                mask if previous_mask is None else previous_mask | mask
+            )
+
+    for column_str, mask in column_masks.items():
+        result.loc[mask, column_str] = fill
 
     return result
 
@@ -490,36 +646,72 @@ def impute(
     3     9.0    2.0  18.0
     """
     if isinstance(constraints, Imputation):
-        result = df.copy()
-
-        columns = tuple(constraints.keys)
-        columns_str = [str(column) for column in columns]
-
-        result.loc[
-            result[columns_str].notna().all(axis="columns")
-            & result[str(constraints.target_key)].isna(),
-            str(constraints.target_key),
-        ] = _lambdify(columns, constraints.operation)(
-            *(result[column_str] for column_str in columns_str)
-        )
-
+        # A shallow copy is enough: _impute_column replaces whole columns, so
+        # only the imputed columns' buffers are ever duplicated.
+        result = df.copy(deep=False)
+        _impute_column(result, str(constraints.target_key), [constraints])
         return result
 
     if isinstance(constraints, Constraints):
-        result = df.copy()
+        result = df.copy(deep=False)
 
+        # Batch imputations sharing a target column so each column is written
+        # back once instead of once per imputation.
+        imputations_by_target: dict[str, list[Imputation]] = {}
         for imputation in constraints.imputations:
-            columns = tuple(imputation.keys)
-            columns_str = [str(column) for column in columns]
-
-            result.loc[
-                result[columns_str].notna().all(axis="columns")
-                & result[str(imputation.target_key)].isna(),
-                str(imputation.target_key),
-            ] = _lambdify(columns, imputation.operation)(
-                *(result[column_str] for column_str in columns_str)
+            imputations_by_target.setdefault(str(imputation.target_key), []).append(
+                imputation
             )
+        for target_str, imputations in imputations_by_target.items():
+            _impute_column(result, target_str, imputations)
 
         return result
 
     raise ValueError(f"Invalid constraints given: {constraints}")
+
+
+def _impute_column(
+    result: pandas.DataFrame, target_str: str, imputations: list[Imputation]
+):
+    """Fill the missing values of one column from its imputations, in-place.
+
+    The masks are computed over the underlying ndarrays, and the first
+    imputation whose source columns are all present wins, matching the order
+    the imputations would have been applied in sequentially.
+    """
+    if not isinstance(result[target_str].dtype, np.dtype):
+        # Extension dtypes (Int64, masked floats, ...) don't round-trip
+        # through an ndarray: the write-back would turn the column into
+        # float64 with NaN. Write through .loc so dtype and NA survive.
+        for imputation in imputations:
+            missing = result[target_str].isna()
+            if not missing.any():
+                break
+            columns, columns_str = _str_keys(imputation.keys)
+            sources = result[list(columns_str)]
+            fill_mask = missing & sources.notna().all(axis=1)
+            if not fill_mask.any():
+                continue
+            relevant = sources[fill_mask.to_numpy()]
+            result.loc[fill_mask, target_str] = _lambdify(
+                columns, imputation.operation
+            )(*(relevant[column].to_numpy() for column in relevant.columns))
+        return
+
+    target = result[target_str].to_numpy(copy=True)
+    missing = result[target_str].isna().to_numpy()
+    for imputation in imputations:
+        if not missing.any():
+            break
+        columns, columns_str = _str_keys(imputation.keys)
+        sources = result[list(columns_str)]
+        fill_mask = missing & sources.notna().to_numpy().all(axis=1)
+        if not fill_mask.any():
+            continue
+        values = _lambdify(columns, imputation.operation)(
+            *(sources[column].to_numpy() for column in sources.columns)
+        )
+        np.copyto(target, values, where=fill_mask)
+        # isna() hands out a read-only buffer, so rebind instead of &=.
+        missing = missing & ~fill_mask
+    result[target_str] = target
@@ -1,5 +1,5 @@
-import random
-from collections import defaultdict
+from functools import lru_cache
+import pickle
 
 from sympy import Eq, Le, Lt, S, solveset, sqrt, Or, Union, And
 from sympy.logic.boolalg import Boolean
@@ -10,32 +10,60 @@ import doctest
 import unittest
 
 
-def extended_solveset(expr: Boolean, *args, **kwargs):
+@lru_cache(maxsize=None)
+def free_symbol_set(expr: Boolean) -> frozenset:
+    # free_symbols walks the expression tree on every access; the same
+    # constraints come through equal_bools and check_validations many times.
+    return frozenset(expr.free_symbols)
+
+
+@lru_cache(maxsize=None)
+def extended_solveset(expr: Boolean, symbol, domain=S.Reals):
     if isinstance(expr, Or):
-        return Union(*(solveset(arg, *args, **kwargs) for arg in expr.args))
-    return solveset(expr, *args, **kwargs)
+        return Union(*(solveset(arg, symbol, domain) for arg in expr.args))
+    return solveset(expr, symbol, domain)
 
 
 def equal_bools(bool1: Boolean, bool2: Boolean, domain=S.Reals):
-    symb1 = frozenset(bool1.free_symbols)
-    symb2 = frozenset(bool2.free_symbols)
+    symb1 = free_symbol_set(bool1)
+    symb2 = free_symbol_set(bool2)
     if symb1 != symb2:
         return False
 
     if len(symb1) == 0:
         return bool1 == bool2
 
-    pivot_symb = random.choice(list(symb1))
+    # Any pivot works; the smallest name keeps runs deterministic and lets the
+    # extended_solveset cache hit across comparisons of the same Boolean.
+    pivot_symb = min(symb1, key=lambda symb: symb.name)
+
+    return extended_solveset(bool1, pivot_symb, domain) == extended_solveset(
+        bool2, pivot_symb, domain
+    )
+
+
+def _imputation_sort_key(imputation: Imputation):
+    return (
+        sorted(map(str, imputation.keys)),
+        str(imputation.target_key),
+        str(imputation.operation),
+    )
+
 
-    return extended_solveset(bool1, pivot_symb, domain=domain) == extended_solveset(
-        bool2, pivot_symb, domain=domain
+def check_imputations(imputations, correct_imputations):
+    # Sorting by a cheap string key hashes nothing; building two frozensets
+    # just to compare them would hash every deep SymPy member twice.
+    assert sorted(imputations, key=_imputation_sort_key) == sorted(
+        correct_imputations, key=_imputation_sort_key
     )
 
 
 def check_validations(validations, correct_constraints):
-    symbols_to_constraints = defaultdict(set)
+    symbols_to_constraints: dict[frozenset, set] = {}
     for constraint in correct_constraints:
-        symbols_to_constraints[frozenset(constraint.free_symbols)].add(constraint)
+        symbols_to_constraints.setdefault(free_symbol_set(constraint), set()).add(
+            constraint
+        )
 
     correct_validations = {
         Validation(frozenset(symbols), frozenset(constraints))
@@ -43,27 +71,40 @@ def check_validations(validations, correct_constraints):
     }
 
     unequal_validations1 = correct_validations - frozenset(validations)
-    unequal_validations2 = set(validations) - correct_validations
+    # A list with an alive mask instead of a set: matching off an entry is a
+    # flag flip rather than a rehash-and-remove of the mutated iterable.
+    unequal_validations2 = list(set(validations) - correct_validations)
+    alive = bytearray([1] * len(unequal_validations2))
 
     for validation1 in unequal_validations1:
         equal_validation = None
-        for validation2 in unequal_validations2:
+        for i, validation2 in enumerate(unequal_validations2):
+            if not alive[i]:
+                continue
             if validation1.keys == validation2.keys and all(
                 any(
-                    equal_bools(constraint1, constraint2)
+                    # Structural equality is far cheaper than the solver path,
+                    # so try it first.
+                    constraint1 == constraint2
+                    or equal_bools(constraint1, constraint2)
                     for constraint2 in validation2.operations
                 )
                 for constraint1 in validation1.operations
             ):
                 equal_validation = validation2
-                unequal_validations2.remove(validation2)
+                alive[i] = 0
                 break
 
         assert (
             equal_validation is not None
         ), f"No equivalent to {validation1} in {validations}"
 
-    assert unequal_validations2 == set(), "Extra validations detected"
+    extra_validations = [
+        validation
+        for validation, is_alive in zip(unequal_validations2, alive)
+        if is_alive
+    ]
+    assert extra_validations == [], "Extra validations detected"
 
 
 def test_inferred_equal_validations():
@@ -113,6 +154,43 @@ def test_inferred_inequality_strictness_validations():
     )
 
 
+def test_pickle_roundtrip():
+    # Constraint sets get shipped to multiprocessing workers or cached on
+    # disk, so the instance must stay picklable.
+    a, b = symbols("a b")
+
+    constraints = Constraints([Eq(a, 2 * b)])
+    restored = pickle.loads(pickle.dumps(constraints))
+
+    assert frozenset(restored.validations) == frozenset(constraints.validations)
+    check_imputations(restored.imputations, constraints.imputations)
+
+
+def test_integer_symbol_validations():
+    # Integer assumptions put infinite domains (Integers, Range) into the
+    # inference loop; construction must not try to enumerate them.
+    a, b = symbols("a b", integer=True)
+
+    constraint1 = a > 2
+    constraint2 = a < 10
+    constraint3 = Eq(b, 2 * a)
+    constraints = Constraints([constraint1, constraint2, constraint3])
+
+    check_validations(
+        constraints.validations,
+        [constraint1, constraint2, constraint3, 3 <= b / 2, b / 2 <= 9],
+    )
+
+    by3 = frozenset([constraint3])
+    check_imputations(
+        constraints.imputations,
+        [
+            Imputation(frozenset([a]), b, 2 * a, inferred_by=by3),
+            Imputation(frozenset([b]), a, b / 2, inferred_by=by3),
+        ],
+    )
+
+
 def test_inferred_equal_imputations():
     a, b, c, d, e = symbols("a b c d e")
 
@@ -120,51 +198,26 @@ def test_inferred_equal_imputations():
     constraint2 = Eq(c, d - e)
     constraints = Constraints([constraint1, constraint2])
 
-    assert frozenset(constraints.imputations) == frozenset(
+    # The inferred-by sets repeat across the expected imputations; build each
+    # one once rather than re-hashing the constraints per entry.
+    by1 = frozenset([constraint1])
+    by2 = frozenset([constraint2])
+    by12 = frozenset([constraint1, constraint2])
+
+    check_imputations(
+        constraints.imputations,
         [
-            Imputation(
-                frozenset([b, c]), a, b + c, inferred_by=frozenset([constraint1])
-            ),
-            Imputation(
-                frozenset([a, c]), b, a - c, inferred_by=frozenset([constraint1])
-            ),
-            Imputation(
-                frozenset([a, b]), c, a - b, inferred_by=frozenset([constraint1])
-            ),
-            Imputation(
-                frozenset([d, e]), c, d - e, inferred_by=frozenset([constraint2])
-            ),
-            Imputation(
-                frozenset([c, e]), d, c + e, inferred_by=frozenset([constraint2])
-            ),
-            Imputation(
-                frozenset([c, d]), e, d - c, inferred_by=frozenset([constraint2])
-            ),
-            Imputation(
-                frozenset([b, d, e]),
-                a,
-                b + d - e,
-                inferred_by=frozenset([constraint1, constraint2]),
-            ),
-            Imputation(
-                frozenset([a, d, e]),
-                b,
-                a - d + e,
-                inferred_by=frozenset([constraint1, constraint2]),
-            ),
-            Imputation(
-                frozenset([a, b, e]),
-                d,
-                a - b + e,
-                inferred_by=frozenset([constraint1, constraint2]),
-            ),
-            Imputation(
-                frozenset([a, b, d]),
-                e,
-                d - a + b,
-                inferred_by=frozenset([constraint1, constraint2]),
-            ),
-        ]
+            Imputation(frozenset([b, c]), a, b + c, inferred_by=by1),
+            Imputation(frozenset([a, c]), b, a - c, inferred_by=by1),
+            Imputation(frozenset([a, b]), c, a - b, inferred_by=by1),
+            Imputation(frozenset([d, e]), c, d - e, inferred_by=by2),
+            Imputation(frozenset([c, e]), d, c + e, inferred_by=by2),
+            Imputation(frozenset([c, d]), e, d - c, inferred_by=by2),
+            Imputation(frozenset([b, d, e]), a, b + d - e, inferred_by=by12),
+            Imputation(frozenset([a, d, e]), b, a - d + e, inferred_by=by12),
+            Imputation(frozenset([a, b, e]), d, a - b + e, inferred_by=by12),
+            Imputation(frozenset([a, b, d]), e, d - a + b, inferred_by=by12),
+        ],
     )
 
 
@@ -191,17 +244,19 @@ def test_square_inequality_validations():
     constraint1 = a**2 > 5
     constraint2 = Eq(a + b, 8)
     constraints = Constraints([constraint1, constraint2])
+    by2 = frozenset([constraint2])
 
     check_validations(
         constraints.validations,
         [constraint1, constraint2, (8 - b) ** 2 > 5],
     )
 
-    assert frozenset(constraints.imputations) == frozenset(
+    check_imputations(
+        constraints.imputations,
         [
-            Imputation(frozenset([b]), a, 8 - b, inferred_by=frozenset([constraint2])),
-            Imputation(frozenset([a]), b, 8 - a, inferred_by=frozenset([constraint2])),
-        ]
+            Imputation(frozenset([b]), a, 8 - b, inferred_by=by2),
+            Imputation(frozenset([a]), b, 8 - a, inferred_by=by2),
+        ],
     )
 
     constraints = Constraints([Eq(a, 2 * b + d), c < (b**2 + a)])
@@ -219,6 +274,7 @@ def test_square_inequality_validations():
     constraint1 = Eq(a, 2 * b + d)
     constraint2 = c > (b**2 + a)
     constraints = Constraints([constraint1, constraint2])
+    by1 = frozenset([constraint1])
 
     check_validations(
         constraints.validations,
@@ -231,18 +287,13 @@ def test_square_inequality_validations():
         ],
     )
 
-    assert frozenset(constraints.imputations) == frozenset(
+    check_imputations(
+        constraints.imputations,
         [
-            Imputation(
-                frozenset([b, d]), a, 2 * b + d, inferred_by=frozenset([constraint1])
-            ),
-            Imputation(
-                frozenset([a, d]), b, (a - d) / 2, inferred_by=frozenset([constraint1])
-            ),
-            Imputation(
-                frozenset([a, b]), d, a - 2 * b, inferred_by=frozenset([constraint1])
-            ),
-        ]
+            Imputation(frozenset([b, d]), a, 2 * b + d, inferred_by=by1),
+            Imputation(frozenset([a, d]), b, (a - d) / 2, inferred_by=by1),
+            Imputation(frozenset([a, b]), d, a - 2 * b, inferred_by=by1),
+        ],
     )
 
     constraints = Constraints([a < b, c < b**2 + 1])
@@ -270,7 +321,7 @@ def test_and_constraint():
         for v in constraints2.validations
     )
 
-    assert frozenset(constraints1.imputations) == frozenset(constraints2.imputations)
+    check_imputations(constraints1.imputations, constraints2.imputations)
 
 
 class OutputChecker(doctest.OutputChecker):
@@ -280,8 +331,6 @@ class OutputChecker(doctest.OutputChecker):
 
 
 def test_docs():
-    assert (
-        unittest.TextTestRunner()
-        .run(doctest.DocTestSuite(constraints, checker=OutputChecker()))
-        .wasSuccessful()
-    )
+    result = unittest.TestResult()
+    doctest.DocTestSuite(constraints, checker=OutputChecker()).run(result)
+    assert result.wasSuccessful(), result.failures
@@ -9,14 +9,20 @@ def check_validation_str(cols, ops, inferred_by):
     validation = Validation(
         frozenset(cols), frozenset(ops), inferred_by=frozenset(inferred_by)
     )
-    match = validation_re.fullmatch(str(validation))
+    # SymPy printing goes through printer dispatch, so stringify everything once.
+    validation_str = str(validation)
+    inferred_by_strs = [str(i) for i in inferred_by]
+    match = validation_re.fullmatch(validation_str)
     assert match is not None
     assert frozenset(var.strip() for var in match.group(1).split(",")) == frozenset(
         cols
     )
     assert match.group(2) == ", ".join(str(op) for op in frozenset(ops))
-    assert all(str(i) in match.group(3) for i in inferred_by)
-    assert str(validation) == repr(validation)
+    inferred_by_group = match.group(3)
+    assert all(
+        inferred_by_str in inferred_by_group for inferred_by_str in inferred_by_strs
+    )
+    assert validation_str == repr(validation)
 
 
 def test_validation_str():
@@ -35,7 +41,9 @@ def check_imputation_str(cols, target, expr, inferred_by):
     imputation = Imputation(
         frozenset(cols), target, expr, inferred_by=frozenset(inferred_by)
     )
-    match = imputation_re.fullmatch(str(imputation))
+    imputation_str = str(imputation)
+    inferred_by_strs = [str(i) for i in inferred_by]
+    match = imputation_re.fullmatch(imputation_str)
     assert match is not None
     assert frozenset(var.strip() for var in match.group(1).split(",")) == frozenset(
         str(c) for c in cols
@@ -43,8 +51,8 @@ def check_imputation_str(cols, target, expr, inferred_by):
     assert match.group(2) == str(target)
     expr_str, inferred_by_str = match.group(3).split("inferred by")
     assert expr_str.strip() == str(expr)
-    assert all(str(i) in inferred_by_str for i in inferred_by)
-    assert str(imputation) == repr(imputation)
+    assert all(s in inferred_by_str for s in inferred_by_strs)
+    assert imputation_str == repr(imputation)
 
 
 def test_imputation_str():